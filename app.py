@@ -1,23 +1,353 @@
 # enhanced_app.py
+import os
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+import pydeck as pdk
 from datetime import datetime
-import folium
-from streamlit_folium import st_folium
+
+from data_generator import FUTODataGenerator
+
+DATA_PATH = "futo_network_data.parquet"
+DATA_SEED = 2024  # Seed used when the dataset has to be generated
+TIME_DATA_PATH = "futo_network_time_data.csv"
+
+# Signal quality buckets: Poor (<=40%), Fair (40-60%), Good (60-80%), Excellent (>80%)
+PERFORMANCE_BINS = [-np.inf, 40, 60, 80, np.inf]
+PERFORMANCE_LEVELS = ['Poor', 'Fair', 'Good', 'Excellent']
+PERFORMANCE_INDICATORS = {'Poor': "🔴", 'Fair': "🟠", 'Good': "🟡", 'Excellent': "🟢"}
+
+# Rating axes of the user experience radar chart
+RATING_CATEGORIES = ('Call Quality', 'Data Speed', 'Reliability')
+
+
+@st.cache_data(persist="disk", show_spinner="Loading FUTO network data...")
+def _load_data(path, mtime, seed=DATA_SEED):
+    """Load or generate data (persisted to disk; mtime keys the cache so a regenerated file is picked up)"""
+    try:
+        df = pd.read_parquet(path)
+    except FileNotFoundError:
+        df = FUTODataGenerator(seed=seed).generate_dataset(samples_per_location=15)
+        # Write to a per-process temp file and swap it in atomically, so concurrent
+        # first runs never read (or clobber) a half-written file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    # Categorical labels: masks and groupbys work on small integer codes, not Python strings.
+    # float32 metrics halve the bytes every mean/std/mask scans (values are shown to 1 d.p.)
+    return df.astype({
+        'location': 'category',
+        'network': 'category',
+        'signal_strength': 'float32',
+        'signal_quality': 'float32',
+        'data_speed': 'float32',
+        'sinr': 'float32'
+    })
+
+
+def _add_performance_level(stats):
+    """Bucket the 'quality' column into level/indicator columns in one vectorized pass"""
+    stats['level'] = pd.cut(stats['quality'], bins=PERFORMANCE_BINS, labels=PERFORMANCE_LEVELS)
+    stats['indicator'] = stats['level'].map(PERFORMANCE_INDICATORS)
+    return stats
+
+
+@st.cache_data(show_spinner=False)
+def _load_time_data(path, mtime):
+    """Load time-based data, or None if missing (mtime keys the cache so file edits are picked up)"""
+    try:
+        return pd.read_csv(path)
+    except FileNotFoundError:
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _simulated_time_data(path, mtime, locations, networks, seed=DATA_SEED):
+    """Time-of-day speeds simulated from each network's mean speed, used when no time data file exists"""
+    time_factors = {"morning": 1.0, "afternoon": 0.8, "evening": 0.6, "night": 1.1}
+
+    # Every (location, network, time of day) combination
+    time_df = pd.MultiIndex.from_product(
+        [list(locations), list(networks), list(time_factors)],
+        names=['location', 'network', 'time_of_day']
+    ).to_frame(index=False)
+
+    # Apply time-based modifiers to each network's mean speed in one vectorized pass
+    df = _load_data(path, mtime)
+    network_speed = df.groupby('network', observed=True)['data_speed'].mean()
+    base_speed = time_df['network'].map(network_speed) * time_df['time_of_day'].map(time_factors)
+    rng = np.random.default_rng(seed)
+    time_df['data_speed'] = np.maximum(1, base_speed + rng.normal(0, 2, size=len(time_df)))
+
+    return time_df
+
+
+@st.cache_data(show_spinner=False)
+def _location_network_stats(path, mtime):
+    """Per-(location, network) means shared by the overview, map and best-network views"""
+    df = _load_data(path, mtime)
+    stats = df.groupby(['location', 'network'], observed=True).agg(
+        quality=('signal_quality', 'mean'),
+        speed=('data_speed', 'mean'),
+        strength=('signal_strength', 'mean'),
+        samples=('signal_quality', 'size')
+    ).reset_index()
+    return _add_performance_level(stats)
+
+
+@st.cache_data(show_spinner=False)
+def _location_stats(path, mtime):
+    """Per-location means derived from the (location, network) stats, weighted by sample count"""
+    stats = _location_network_stats(path, mtime)
+    totals = stats[['quality', 'speed', 'strength']].mul(stats['samples'], axis=0)
+    samples = stats.groupby('location', observed=True)['samples'].sum()
+    return _add_performance_level(totals.groupby(stats['location'], observed=True).sum().div(samples, axis=0))
+
+
+@st.cache_data(show_spinner=False)
+def _calculate_metrics(path, mtime, networks):
+    """Calculate overall metrics"""
+    df = _load_data(path, mtime)
+    stats = df.assign(reliable=df['signal_quality'] > 70).groupby('network', observed=True).agg(
+        avg_signal_strength=('signal_strength', 'mean'),
+        avg_signal_quality=('signal_quality', 'mean'),
+        avg_data_speed=('data_speed', 'mean'),
+        reliability_score=('reliable', 'mean')
+    )
+    stats['reliability_score'] *= 100
+    return stats.reindex(list(networks)).to_dict('index')
+
+
+@st.cache_data(show_spinner=False)
+def _best_network_per_location(path, mtime, locations, networks):
+    """Determine best network for each location"""
+    stats = _location_network_stats(path, mtime)
+    stats = stats[stats['location'].isin(locations) & stats['network'].isin(networks)]
+    quality = stats.pivot(index='location', columns='network', values='quality')
+    strength = stats.pivot(index='location', columns='network', values='strength')
+    speed = stats.pivot(index='location', columns='network', values='speed')
+
+    # Composite score matrix (locations x networks) considering all metrics
+    scores = quality * 0.3 + (100 - (strength + 80).abs()) * 0.3 + speed * 0.4
+    best = scores.dropna(how='all').idxmax(axis=1)
+    return {location: best[location] for location in locations if location in best.index}
+
+
+@st.cache_resource(show_spinner=False)
+def _campus_overview_deck(coords_df):
+    """Build the campus overview map once per process (30 static points, WebGL rendered)"""
+    layer = pdk.Layer(
+        "ScatterplotLayer",
+        data=coords_df,
+        get_position='[lon, lat]',
+        get_fill_color=[0, 0, 255, 200],
+        get_radius=8,
+        radius_min_pixels=6,
+        pickable=True
+    )
+    return pdk.Deck(
+        layers=[layer],
+        initial_view_state=pdk.ViewState(latitude=5.4074, longitude=7.0716, zoom=15),
+        tooltip={"html": "<b>{location}</b>"},
+        map_style=None
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _distribution_figure(path, mtime, column, title):
+    """Box plot of one metric by network, drawn from server-side quartiles instead of raw points"""
+    summary = _load_data(path, mtime).groupby('network', observed=True, sort=False)[column].describe(percentiles=[.25, .5, .75])
+    fig = go.Figure([
+        go.Box(
+            name=network,
+            x=[network],
+            q1=[row['25%']],
+            median=[row['50%']],
+            q3=[row['75%']],
+            lowerfence=[row['min']],
+            upperfence=[row['max']],
+            boxpoints=False
+        )
+        for network, row in summary.iterrows()
+    ])
+    fig.update_layout(title=title, xaxis_title='network', yaxis_title=column, legend_title_text='network')
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _bar_figure(x, y, title, x_label, y_label):
+    """Bar chart for a small labelled series, rebuilt only when the values change"""
+    return px.bar(x=list(x), y=list(y), title=title, labels={'x': x_label, 'y': y_label})
+
+
+@st.cache_resource(show_spinner=False)
+def _reliability_figure(reliability_scores):
+    """Stacked reliability breakdown chart from the per-network component scores"""
+    fig = go.Figure()
+    for metric in ['consistency', 'coverage', 'speed_stability']:
+        fig.add_trace(go.Bar(name=metric.title(), x=reliability_scores.index, y=reliability_scores[metric]))
+
+    fig.update_layout(barmode='stack', title="Reliability Score Breakdown")
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _coverage_pie_figure(networks, counts):
+    """Pie chart of the number of locations where each network is best"""
+    return px.pie(
+        values=list(counts),
+        names=list(networks),
+        title="Locations Where Each Network is Best",
+        color=list(networks),
+        color_discrete_map={
+            'MTN': '#FF6B6B',
+            'Airtel': '#4ECDC4',
+            'Glo': '#45B7D1',
+            '9mobile': '#96CEB4'
+        }
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _area_performance_figure(area_types, performance):
+    """Box plot of location signal quality grouped by area type"""
+    area_df = pd.DataFrame({'Area Type': list(area_types), 'Performance': list(performance)})
+    return px.box(area_df, x='Area Type', y='Performance', color='Area Type',
+                  title="Network Performance Distribution by Area Type")
+
+
+@st.cache_resource(show_spinner=False)
+def _radar_figure(ratings):
+    """Radar chart of per-network ratings; ratings is a tuple of (network, (call, speed, reliability))"""
+    fig = go.Figure()
+    for network, values in ratings:
+        fig.add_trace(go.Scatterpolar(
+            r=list(values),
+            theta=list(RATING_CATEGORIES),
+            fill='toself',
+            name=network
+        ))
+
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 5])),
+        title="User Experience Ratings Comparison"
+    )
+    return fig
+
+
+@st.fragment
+def _render_performance_map(perf_df):
+    """Map-style selector and performance heatmap; a style change reruns only this fragment"""
+    # Map style selector - removed stamen-terrain
+    col1, col2 = st.columns([3, 1])
+
+    with col2:
+        map_style = st.selectbox(
+            "Choose Map Style:",
+            ["open-street-map", "carto-positron", "carto-darkmatter", "stamen-toner", "white-bg"],
+            index=0
+        )
+
+    # Option 1: Proper Interactive Map with Real FUTO Layout
+    st.write("#### 🗺️ Interactive FUTO Campus Map")
+
+    # FUTO main campus coordinates (more accurate)
+    futo_center = [5.4074, 7.0716]  # More precise FUTO coordinates
+
+    if not perf_df.empty:
+        # Handle white-bg style specially
+        if map_style == "white-bg":
+            map_style = "open-street-map"
+            fig = px.scatter_mapbox(
+                perf_df,
+                lat='lat',
+                lon='lon',
+                color='performance',
+                size='performance',
+                hover_name='location',
+                hover_data={
+                    'best_network': True,
+                    'performance': ':.1f',
+                    'avg_speed': ':.1f',
+                    'signal_strength': ':.1f',
+                    'lat': False,
+                    'lon': False
+                },
+                color_continuous_scale="RdYlGn",
+                size_max=25,
+                zoom=16,
+                height=600,
+                title=f"FUTO Campus - Network Performance Heatmap"
+            )
+            fig.update_layout(mapbox_style="white-bg")
+        else:
+            fig = px.scatter_mapbox(
+                perf_df,
+                lat='lat',
+                lon='lon',
+                color='performance',
+                size='performance',  # Size based on performance
+                hover_name='location',
+                hover_data={
+                    'best_network': True,
+                    'performance': ':.1f',
+                    'avg_speed': ':.1f',
+                    'signal_strength': ':.1f',
+                    'lat': False,
+                    'lon': False
+                },
+                color_continuous_scale="RdYlGn",  # Red-Yellow-Green scale
+                size_max=25,
+                zoom=16,
+                height=600,
+                title=f"FUTO Campus - Network Performance Heatmap ({map_style.replace('-', ' ').title()})"
+            )
+            fig.update_layout(mapbox_style=map_style)
+
+        # Update layout for better appearance
+        fig.update_layout(
+            mapbox=dict(
+                center=dict(lat=futo_center[0], lon=futo_center[1]),
+                zoom=16
+            ),
+            margin={"r": 0, "t": 50, "l": 0, "b": 0},
+            coloraxis_colorbar=dict(
+                title="Signal Quality %",
+                thickness=20,
+                len=0.75
+            )
+        )
+
+        # Add custom hover template
+        fig.update_traces(
+            hovertemplate=(
+                "<b>%{hovertext}</b><br><br>"
+                "Best Network: %{customdata[0]}<br>"
+                "Signal Quality: %{customdata[1]:.1f}%<br>"
+                "Avg Speed: %{customdata[2]:.1f} Mbps<br>"
+                "Signal Strength: %{customdata[3]:.1f} dBm"
+                "<extra></extra>"
+            )
+        )
+
+        st.plotly_chart(fig, use_container_width=True)
 
 
 class EnhancedFUTODashboard:
     def __init__(self):
         self.generator = FUTODataGenerator()
-        self.df = self.load_data()
+        # Data file mtime (0 if it has to be generated) keys every cached view of the dataset
+        self.data_mtime = os.path.getmtime(DATA_PATH) if os.path.exists(DATA_PATH) else 0
+        self.df = _load_data(DATA_PATH, self.data_mtime)
+        self._loc_net_stats = _location_network_stats(DATA_PATH, self.data_mtime)
         self.setup_coordinates()
 
     def setup_coordinates(self):
         """Set up approximate coordinates for FUTO locations"""
-        self.location_coordinates = {
+        location_coordinates = {
             "Front Gate": {"lat": 5.4063, "lon": 7.0713},
             "SENATE Building": {"lat": 5.4070, "lon": 7.0720},
             "Library": {"lat": 5.4075, "lon": 7.0710},
@@ -50,67 +380,20 @@ class EnhancedFUTODashboard:
             "Futo Park": {"lat": 5.4078, "lon": 7.0705}
         }
 
-    def load_data(self):
-        """Load or generate data"""
-        try:
-            df = pd.read_csv("futo_network_data.csv")
-        except:
-            st.info("Generating realistic FUTO network data...")
-            df = self.generator.generate_dataset(samples_per_location=15)
-            df.to_csv("futo_network_data.csv", index=False)
-        return df
+        # Columnar (location, lat, lon) frame so map views can join against the stats frames
+        self.coords_df = (pd.DataFrame.from_dict(location_coordinates, orient='index')
+                          .rename_axis('location').reset_index())
 
     def create_campus_overview_map(self):
         """NEW: Create campus overview map showing all locations"""
         st.subheader("🗺️ FUTO Campus Overview")
 
         # Create a simple map showing all locations
-        map_data = []
-        for location, coords in self.location_coordinates.items():
-            map_data.append({
-                'lat': coords['lat'],
-                'lon': coords['lon'],
-                'location': location,
-                'color': 'blue'
-            })
-
-        map_df = pd.DataFrame(map_data)
-
-        if not map_df.empty:
-            fig = px.scatter_mapbox(
-                map_df,
-                lat='lat',
-                lon='lon',
-                hover_name='location',
-                hover_data={'lat': False, 'lon': False},
-                color_discrete_sequence=['blue'],
-                size_max=15,
-                zoom=15,
-                height=400,
-                title="FUTO Campus - All 30 Locations"
-            )
-
-            fig.update_layout(
-                mapbox_style="open-street-map",
-                mapbox=dict(
-                    center=dict(lat=5.4074, lon=7.0716),
-                    zoom=15
-                ),
-                margin={"r": 0, "t": 50, "l": 0, "b": 0},
-                showlegend=False
-            )
-
-            # Add custom hover template
-            fig.update_traces(
-                hovertemplate=(
-                    "<b>%{hovertext}</b>"
-                    "<extra></extra>"
-                ),
-                marker=dict(size=12)
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+        if not self.coords_df.empty:
+            st.caption("FUTO Campus - All 30 Locations")
+            st.pydeck_chart(_campus_overview_deck(self.coords_df), use_container_width=True)
 
+    @st.fragment
     def create_overview_metrics(self):
         """Display overview metrics with performance table for ALL locations"""
         st.markdown('<div class="main-header">📶 FUTO Mobile Network Analysis Dashboard</div>', unsafe_allow_html=True)
@@ -121,7 +404,7 @@ class EnhancedFUTODashboard:
         metrics = self.calculate_metrics()
         best_networks = self.get_best_network_per_location()
 
-        col1, col2, col3, col4 = st.columns(4)
+        cols = st.columns(len(self.generator.networks))
 
         # Find overall best and worst networks
         overall_scores = {}
@@ -131,9 +414,9 @@ class EnhancedFUTODashboard:
         best_network = max(overall_scores, key=overall_scores.get)
         worst_network = min(overall_scores, key=overall_scores.get)
 
-        for network in self.generator.networks:
+        for idx, network in enumerate(self.generator.networks):
             metric_data = metrics[network]
-            with col1 if network == "MTN" else col2 if network == "Airtel" else col3 if network == "Glo" else col4:
+            with cols[idx]:
                 css_class = "metric-card best-network" if network == best_network else "metric-card worst-network" if network == worst_network else "metric-card"
                 st.markdown(f'<div class="{css_class}">', unsafe_allow_html=True)
                 st.metric(
@@ -147,86 +430,33 @@ class EnhancedFUTODashboard:
         # NEW: Network Performance Summary Table for ALL 30 Locations
         st.subheader("📋 Network Performance Across All 30 Campus Locations")
 
-        # Create performance table for ALL locations
-        performance_data = []
-        for location in self.generator.locations:  # Use ALL locations
-            location_data = self.df[self.df['location'] == location]
-            location_performance = {}
-
-            for network in self.generator.networks:
-                network_data = location_data[location_data['network'] == network]
-                if len(network_data) > 0:
-                    avg_quality = network_data['signal_quality'].mean()
-                    avg_speed = network_data['data_speed'].mean()
-
-                    # Create performance indicator
-                    if avg_quality > 80:
-                        indicator = "🟢"
-                        level = "Excellent"
-                    elif avg_quality > 60:
-                        indicator = "🟡"
-                        level = "Good"
-                    elif avg_quality > 40:
-                        indicator = "🟠"
-                        level = "Fair"
-                    else:
-                        indicator = "🔴"
-                        level = "Poor"
-
-                    location_performance[network] = {
-                        'quality': f"{avg_quality:.1f}%",
-                        'speed': f"{avg_speed:.1f} Mbps",
-                        'indicator': indicator,
-                        'level': level
-                    }
-                else:
-                    location_performance[network] = {
-                        'quality': "N/A",
-                        'speed': "N/A",
-                        'indicator': "⚫",
-                        'level': "No Data"
-                    }
-
-            # Find best network for this location
-            best_net = best_networks.get(location, "Unknown")
-
-            performance_data.append({
-                'Location': location,
-                'Best Network': best_net,
-                'MTN': location_performance['MTN'],
-                'Airtel': location_performance['Airtel'],
-                'Glo': location_performance['Glo'],
-                '9mobile': location_performance['9mobile']
-            })
-
         # Display ALL locations in a scrollable table
         st.write("#### 📊 Detailed Performance Table")
 
-        # Create a DataFrame for the table view
-        table_data = []
-        for location_data in performance_data:
-            table_data.append({
-                'Location': location_data['Location'],
-                'Best Network': location_data['Best Network'],
-                'MTN Quality': location_data['MTN']['quality'],
-                'MTN Speed': location_data['MTN']['speed'],
-                'MTN Level': location_data['MTN']['level'],
-                'Airtel Quality': location_data['Airtel']['quality'],
-                'Airtel Speed': location_data['Airtel']['speed'],
-                'Airtel Level': location_data['Airtel']['level'],
-                'Glo Quality': location_data['Glo']['quality'],
-                'Glo Speed': location_data['Glo']['speed'],
-                'Glo Level': location_data['Glo']['level'],
-                '9mobile Quality': location_data['9mobile']['quality'],
-                '9mobile Speed': location_data['9mobile']['speed'],
-                '9mobile Level': location_data['9mobile']['level']
-            })
-
-        table_df = pd.DataFrame(table_data)
+        # Create performance table for ALL locations by pivoting the location/network stats
+        pivot = self._loc_net_stats.pivot(index='location', columns='network').reindex(self.generator.locations)
+        indicators = pivot['indicator'].astype(object).where(pivot['indicator'].notna(), "⚫")
+        # Quality/speed stay numeric; Streamlit formats them client-side (and sorts them as numbers)
+        columns = {
+            'Quality': pivot['quality'],
+            'Speed': pivot['speed'],
+            'Level': pivot['level'].astype(object).where(pivot['level'].notna(), "No Data")
+        }
+        table_df = pd.concat(columns, axis=1)
+        table_df = table_df[[(metric, network) for network in self.generator.networks for metric in columns]]
+        table_df.columns = [f"{network} {metric}" for metric, network in table_df.columns]
+        table_df.insert(0, 'Best Network', table_df.index.map(best_networks).fillna("Unknown"))
+        table_df = table_df.rename_axis('Location')
+
+        column_config = {}
+        for network in self.generator.networks:
+            column_config[f"{network} Quality"] = st.column_config.NumberColumn(format="%.1f%%")
+            column_config[f"{network} Speed"] = st.column_config.NumberColumn(format="%.1f Mbps")
 
         # Display the full table
         st.dataframe(
-            table_df,
+            table_df.reset_index(),
+            column_config=column_config,
             use_container_width=True,
             height=600  # Scrollable height
         )
@@ -254,8 +484,8 @@ class EnhancedFUTODashboard:
         for area_name, area_locations in area_groups.items():
             with st.expander(f"{area_name} ({len(area_locations)} locations)", expanded=False):
                 for location in area_locations:
-                    location_data = next((item for item in performance_data if item['Location'] == location), None)
-                    if location_data:
+                    if location in table_df.index:
+                        location_data = table_df.loc[location]
                         cols = st.columns(5)
                         with cols[0]:
                             st.write(f"**{location}**")
@@ -264,13 +494,15 @@ class EnhancedFUTODashboard:
                         networks = ['MTN', 'Airtel', 'Glo', '9mobile']
                         for idx, network in enumerate(networks):
                             with cols[idx + 1]:
-                                perf = location_data[network]
+                                quality = location_data[f'{network} Quality']
+                                speed = location_data[f'{network} Speed']
                                 st.metric(
                                     label=f"{network}",
-                                    value=f"{perf['indicator']} {perf['quality']}",
-                                    delta=perf['speed']
+                                    value=f"{indicators.at[location, network]} "
+                                          + (f"{quality:.1f}%" if pd.notna(quality) else "N/A"),
+                                    delta=f"{speed:.1f} Mbps" if pd.notna(speed) else "N/A"
                                 )
-                                st.caption(perf['level'])
+                                st.caption(location_data[f'{network} Level'])
                         st.markdown("---")
 
         # Quick insights
@@ -283,35 +515,14 @@ class EnhancedFUTODashboard:
 
     def calculate_metrics(self):
         """Calculate overall metrics"""
-        metrics = {}
-        for network in self.generator.networks:
-            network_data = self.df[self.df['network'] == network]
-            metrics[network] = {
-                'avg_signal_strength': network_data['signal_strength'].mean(),
-                'avg_signal_quality': network_data['signal_quality'].mean(),
-                'avg_data_speed': network_data['data_speed'].mean(),
-                'reliability_score': (network_data['signal_quality'] > 70).mean() * 100
-            }
-        return metrics
+        return _calculate_metrics(DATA_PATH, self.data_mtime, tuple(self.generator.networks))
 
     def get_best_network_per_location(self):
         """Determine best network for each location"""
-        best_networks = {}
-        for location in self.generator.locations:
-            location_data = self.df[self.df['location'] == location]
-            scores = {}
-            for network in self.generator.networks:
-                net_data = location_data[location_data['network'] == network]
-                if len(net_data) > 0:
-                    # Composite score considering all metrics
-                    score = (net_data['signal_quality'].mean() * 0.3 +
-                             (100 - abs(net_data['signal_strength'].mean() + 80)) * 0.3 +
-                             net_data['data_speed'].mean() * 0.4)
-                    scores[network] = score
-            if scores:
-                best_networks[location] = max(scores, key=scores.get)
-        return best_networks
+        return _best_network_per_location(DATA_PATH, self.data_mtime, tuple(self.generator.locations),
+                                          tuple(self.generator.networks))
 
+    @st.fragment
     def create_network_comparison_charts(self):
         """Create comparison charts"""
         st.subheader("📊 Network Performance Comparison")
@@ -319,29 +530,22 @@ class EnhancedFUTODashboard:
         tab1, tab2, tab3, tab4 = st.tabs(["Signal Strength", "Signal Quality", "Data Speed", "SINR"])
 
         with tab1:
-            fig = px.box(self.df, x='network', y='signal_strength',
-                         title="Signal Strength Distribution by Network",
-                         color='network')
+            fig = _distribution_figure(DATA_PATH, self.data_mtime, 'signal_strength', "Signal Strength Distribution by Network")
             st.plotly_chart(fig, use_container_width=True)
 
         with tab2:
-            fig = px.box(self.df, x='network', y='signal_quality',
-                         title="Signal Quality Distribution by Network",
-                         color='network')
+            fig = _distribution_figure(DATA_PATH, self.data_mtime, 'signal_quality', "Signal Quality Distribution by Network")
             st.plotly_chart(fig, use_container_width=True)
 
         with tab3:
-            fig = px.box(self.df, x='network', y='data_speed',
-                         title="Data Speed Distribution by Network",
-                         color='network')
+            fig = _distribution_figure(DATA_PATH, self.data_mtime, 'data_speed', "Data Speed Distribution by Network")
             st.plotly_chart(fig, use_container_width=True)
 
         with tab4:
-            fig = px.box(self.df, x='network', y='sinr',
-                         title="SINR Distribution by Network",
-                         color='network')
+            fig = _distribution_figure(DATA_PATH, self.data_mtime, 'sinr', "SINR Distribution by Network")
             st.plotly_chart(fig, use_container_width=True)
 
+    @st.fragment
     def create_cost_benefit_analysis(self):
         """Feature 1: Cost-Benefit Analysis"""
         st.subheader("💰 Cost-Benefit Analysis")
@@ -351,48 +555,44 @@ class EnhancedFUTODashboard:
         with col1:
             st.write("### Data Plan Prices (₦)")
             cost_data = self.generator.cost_data
-            cost_df = pd.DataFrame(cost_data).T
+            cost_df = pd.DataFrame.from_dict(cost_data, orient='index')
             st.dataframe(cost_df.style.format("₦{:.0f}"), use_container_width=True)
 
         with col2:
             st.write("### Cost per Mbps Value")
+            avg_speed = self.df.groupby('network', observed=True)['data_speed'].mean()
             value_scores = {}
             for network in self.generator.networks:
-                avg_speed = self.df[self.df['network'] == network]['data_speed'].mean()
                 cost_per_gb = cost_data[network]["1GB"]
-                value_score = (avg_speed / cost_per_gb) * 100
+                value_score = (avg_speed[network] / cost_per_gb) * 100
                 value_scores[network] = value_score
 
-            fig = px.bar(x=list(value_scores.keys()), y=list(value_scores.values()),
-                         title="Value for Money Score (Higher is Better)",
-                         labels={'x': 'Network', 'y': 'Value Score'})
+            fig = _bar_figure(tuple(value_scores.keys()), tuple(value_scores.values()),
+                              "Value for Money Score (Higher is Better)", 'Network', 'Value Score')
             st.plotly_chart(fig, use_container_width=True)
 
+    @st.fragment
     def create_reliability_scoring(self):
         """Feature 2: Network Reliability Scoring"""
         st.subheader("🛡️ Network Reliability Scoring")
 
-        reliability_scores = {}
+        # Calculate reliability components for every network in one grouped pass
+        agg = self.df.assign(covered=self.df['signal_quality'] > 70).groupby('network', observed=True).agg(
+            quality_std=('signal_quality', 'std'),
+            coverage=('covered', 'mean'),
+            speed_std=('data_speed', 'std')
+        ).reindex(self.generator.networks)
 
-        for network in self.generator.networks:
-            network_data = self.df[self.df['network'] == network]
-
-            # Calculate reliability components
-            consistency_score = (100 - network_data['signal_quality'].std()) * 0.3
-            coverage_score = (network_data['signal_quality'] > 70).mean() * 100 * 0.4
-            speed_stability = (100 - network_data['data_speed'].std()) * 0.3
-
-            total_score = consistency_score + coverage_score + speed_stability
-            reliability_scores[network] = {
-                'total': total_score,
-                'consistency': consistency_score,
-                'coverage': coverage_score,
-                'speed_stability': speed_stability
-            }
+        reliability_scores = pd.DataFrame({
+            'consistency': (100 - agg['quality_std']) * 0.3,
+            'coverage': agg['coverage'] * 100 * 0.4,
+            'speed_stability': (100 - agg['speed_std']) * 0.3
+        })
+        reliability_scores['total'] = reliability_scores.sum(axis=1)
 
         # Display reliability scores
         cols = st.columns(4)
-        for idx, (network, scores) in enumerate(reliability_scores.items()):
+        for idx, (network, scores) in enumerate(reliability_scores.iterrows()):
             with cols[idx]:
                 st.metric(
                     label=f"{network} Reliability",
@@ -401,25 +601,18 @@ class EnhancedFUTODashboard:
                 )
 
         # Reliability breakdown chart
-        fig = go.Figure()
-        for metric in ['consistency', 'coverage', 'speed_stability']:
-            fig.add_trace(go.Bar(
-                name=metric.title(),
-                x=list(reliability_scores.keys()),
-                y=[scores[metric] for scores in reliability_scores.values()]
-            ))
-
-        fig.update_layout(barmode='stack', title="Reliability Score Breakdown")
+        fig = _reliability_figure(reliability_scores)
         st.plotly_chart(fig, use_container_width=True)
 
+    @st.fragment
     def create_time_based_analysis(self):
         """Feature 3: Time-based Performance Analysis"""
         st.subheader("⏰ Time-based Performance Analysis")
 
         # Try to load time-based data, or simulate it
-        try:
-            time_df = pd.read_csv("futo_network_time_data.csv")
-        except:
+        mtime = os.path.getmtime(TIME_DATA_PATH) if os.path.exists(TIME_DATA_PATH) else 0
+        time_df = _load_time_data(TIME_DATA_PATH, mtime)
+        if time_df is None:
             # Simulate time-based data if file doesn't exist
             time_df = self.simulate_time_data()
 
@@ -433,157 +626,37 @@ class EnhancedFUTODashboard:
 
         # Peak hours analysis
         st.write("### 📊 Peak Hours Performance Drop")
-        peak_drop = {}
-        for network in self.generator.networks:
-            network_data = self.df[self.df['network'] == network]
-            avg_speed = network_data['data_speed'].mean()
-            # Simulate peak hour drop (40% reduction during evening)
-            peak_drop[network] = avg_speed * 0.4  # 40% performance drop
-
-        fig = px.bar(x=list(peak_drop.keys()), y=list(peak_drop.values()),
-                     title="Performance Drop During Peak Hours (Simulated)",
-                     labels={'x': 'Network', 'y': 'Speed Reduction (Mbps)'})
+        avg_speed = self.df.groupby('network', observed=True)['data_speed'].mean().reindex(self.generator.networks)
+        # Simulate peak hour drop (40% reduction during evening)
+        peak_drop = avg_speed * 0.4  # 40% performance drop
+
+        fig = _bar_figure(tuple(peak_drop.index), tuple(peak_drop.tolist()),
+                          "Performance Drop During Peak Hours (Simulated)", 'Network', 'Speed Reduction (Mbps)')
         st.plotly_chart(fig, use_container_width=True)
 
     def simulate_time_data(self):
-        """Simulate time-based data if not available"""
-        times_of_day = ["morning", "afternoon", "evening", "night"]
-        data = []
-
-        for location in self.generator.locations[:5]:  # Sample locations for speed
-            for network in self.generator.networks:
-                for time_of_day in times_of_day:
-                    base_speed = self.df[self.df['network'] == network]['data_speed'].mean()
-                    # Apply time-based modifiers
-                    time_factors = {"morning": 1.0, "afternoon": 0.8, "evening": 0.6, "night": 1.1}
-                    speed = base_speed * time_factors[time_of_day] + np.random.normal(0, 2)
-
-                    data.append({
-                        'location': location,
-                        'network': network,
-                        'time_of_day': time_of_day,
-                        'data_speed': max(1, speed)
-                    })
-
-        return pd.DataFrame(data)
+        """Simulate time-based data for a few sample locations if not available"""
+        return _simulated_time_data(DATA_PATH, self.data_mtime, tuple(self.generator.locations[:5]),
+                                    tuple(self.generator.networks))
 
+    @st.fragment
     def create_live_performance_map(self):
         """Feature 5: Live Network Performance Map"""
         st.subheader("📡 Live Network Performance Map")
 
-        # Map style selector - removed stamen-terrain
-        col1, col2 = st.columns([3, 1])
-
-        with col2:
-            map_style = st.selectbox(
-                "Choose Map Style:",
-                ["open-street-map", "carto-positron", "carto-darkmatter", "stamen-toner", "white-bg"],
-                index=0
-            )
-
-        # Option 1: Proper Interactive Map with Real FUTO Layout
-        st.write("#### 🗺️ Interactive FUTO Campus Map")
-
-        # FUTO main campus coordinates (more accurate)
-        futo_center = [5.4074, 7.0716]  # More precise FUTO coordinates
-
         # Create performance data for the map
-        performance_data = []
-        for location, coords in self.location_coordinates.items():
-            location_data = self.df[self.df['location'] == location]
-            if len(location_data) > 0:
-                avg_performance = location_data['signal_quality'].mean()
-                best_network = self.get_best_network_per_location().get(location, "Unknown")
-
-                performance_data.append({
-                    'lat': coords['lat'],
-                    'lon': coords['lon'],
-                    'performance': avg_performance,
-                    'location': location,
-                    'best_network': best_network,
-                    'avg_speed': location_data['data_speed'].mean(),
-                    'signal_strength': location_data['signal_strength'].mean()
-                })
-
-        perf_df = pd.DataFrame(performance_data)
-
-        if not perf_df.empty:
-            # Handle white-bg style specially
-            if map_style == "white-bg":
-                map_style = "open-street-map"
-                fig = px.scatter_mapbox(
-                    perf_df,
-                    lat='lat',
-                    lon='lon',
-                    color='performance',
-                    size='performance',
-                    hover_name='location',
-                    hover_data={
-                        'best_network': True,
-                        'performance': ':.1f',
-                        'avg_speed': ':.1f',
-                        'signal_strength': ':.1f',
-                        'lat': False,
-                        'lon': False
-                    },
-                    color_continuous_scale="RdYlGn",
-                    size_max=25,
-                    zoom=16,
-                    height=600,
-                    title=f"FUTO Campus - Network Performance Heatmap"
-                )
-                fig.update_layout(mapbox_style="white-bg")
-            else:
-                fig = px.scatter_mapbox(
-                    perf_df,
-                    lat='lat',
-                    lon='lon',
-                    color='performance',
-                    size='performance',  # Size based on performance
-                    hover_name='location',
-                    hover_data={
-                        'best_network': True,
-                        'performance': ':.1f',
-                        'avg_speed': ':.1f',
-                        'signal_strength': ':.1f',
-                        'lat': False,
-                        'lon': False
-                    },
-                    color_continuous_scale="RdYlGn",  # Red-Yellow-Green scale
-                    size_max=25,
-                    zoom=16,
-                    height=600,
-                    title=f"FUTO Campus - Network Performance Heatmap ({map_style.replace('-', ' ').title()})"
-                )
-                fig.update_layout(mapbox_style=map_style)
-
-            # Update layout for better appearance
-            fig.update_layout(
-                mapbox=dict(
-                    center=dict(lat=futo_center[0], lon=futo_center[1]),
-                    zoom=16
-                ),
-                margin={"r": 0, "t": 50, "l": 0, "b": 0},
-                coloraxis_colorbar=dict(
-                    title="Signal Quality %",
-                    thickness=20,
-                    len=0.75
-                )
-            )
+        location_stats = _location_stats(DATA_PATH, self.data_mtime)
+        best_networks = self.get_best_network_per_location()
+        perf_df = self.coords_df.merge(
+            location_stats[['quality', 'speed', 'strength']].rename(columns={
+                'quality': 'performance', 'speed': 'avg_speed', 'strength': 'signal_strength'
+            }),
+            left_on='location',
+            right_index=True
+        )
+        perf_df['best_network'] = perf_df['location'].map(best_networks).fillna("Unknown")
 
-            # Add custom hover template
-            fig.update_traces(
-                hovertemplate=(
-                    "<b>%{hovertext}</b><br><br>"
-                    "Best Network: %{customdata[0]}<br>"
-                    "Signal Quality: %{customdata[1]:.1f}%<br>"
-                    "Avg Speed: %{customdata[2]:.1f} Mbps<br>"
-                    "Signal Strength: %{customdata[3]:.1f} dBm"
-                    "<extra></extra>"
-                )
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+        _render_performance_map(perf_df)
 
         # Option 2: Network Coverage Summary
         st.write("#### 📊 Network Coverage Summary")
@@ -592,21 +665,9 @@ class EnhancedFUTODashboard:
 
         with col1:
             # Best network by location count
-            best_networks = self.get_best_network_per_location()
             network_counts = pd.Series(best_networks).value_counts()
 
-            fig = px.pie(
-                values=network_counts.values,
-                names=network_counts.index,
-                title="Locations Where Each Network is Best",
-                color=network_counts.index,
-                color_discrete_map={
-                    'MTN': '#FF6B6B',
-                    'Airtel': '#4ECDC4',
-                    'Glo': '#45B7D1',
-                    '9mobile': '#96CEB4'
-                }
-            )
+            fig = _coverage_pie_figure(tuple(network_counts.index), tuple(network_counts.values.tolist()))
             st.plotly_chart(fig, use_container_width=True)
 
         with col2:
@@ -624,77 +685,66 @@ class EnhancedFUTODashboard:
             area_data = []
             for area_type, locations in area_types.items():
                 for location in locations:
-                    loc_data = self.df[self.df['location'] == location]
-                    if len(loc_data) > 0:
+                    if location in location_stats.index:
                         best_net = best_networks.get(location, "Unknown")
                         area_data.append({
                             'Area Type': area_type,
                             'Location': location,
                             'Best Network': best_net,
-                            'Performance': loc_data['signal_quality'].mean()
+                            'Performance': location_stats.loc[location, 'quality']
                         })
 
             if area_data:
-                area_df = pd.DataFrame(area_data)
-                fig = px.box(area_df, x='Area Type', y='Performance', color='Area Type',
-                             title="Network Performance Distribution by Area Type")
+                fig = _area_performance_figure(tuple(row['Area Type'] for row in area_data),
+                                               tuple(row['Performance'] for row in area_data))
                 st.plotly_chart(fig, use_container_width=True)
 
         # Option 3: Detailed Location Performance Table
         st.write("#### 📋 Detailed Location Performance")
 
-        # Create summary table
-        summary_data = []
-        for location in self.generator.locations:
-            location_data = self.df[self.df['location'] == location]
-            if len(location_data) > 0:
-                best_net = best_networks.get(location, "Unknown")
-                avg_quality = location_data['signal_quality'].mean()
-                avg_speed = location_data['data_speed'].mean()
-
-                # Color code the performance level
-                if avg_quality > 80:
-                    performance_level = "🟢 Excellent"
-                elif avg_quality > 60:
-                    performance_level = "🟡 Good"
-                elif avg_quality > 40:
-                    performance_level = "🟠 Fair"
-                else:
-                    performance_level = "🔴 Poor"
-
-                summary_data.append({
-                    'Location': location,
-                    'Best Network': best_net,
-                    'Avg Signal Quality': f"{avg_quality:.1f}%",
-                    'Avg Data Speed': f"{avg_speed:.1f} Mbps",
-                    'Performance Level': performance_level
-                })
-
-        summary_df = pd.DataFrame(summary_data)
+        # Create summary table with numeric quality/speed columns
+        stats = location_stats.reindex([location for location in self.generator.locations
+                                        if location in location_stats.index])
+        summary_df = pd.DataFrame({
+            'Location': stats.index,
+            'Best Network': stats.index.map(best_networks).fillna("Unknown"),
+            'Avg Signal Quality': stats['quality'].to_numpy(),
+            'Avg Data Speed': stats['speed'].to_numpy(),
+            'Performance Level': (stats['indicator'].astype(str) + " " + stats['level'].astype(str)).to_numpy()
+        })
 
         # Add some styling to the dataframe
         st.dataframe(
             summary_df,
+            column_config={
+                'Avg Signal Quality': st.column_config.NumberColumn(format="%.1f%%"),
+                'Avg Data Speed': st.column_config.NumberColumn(format="%.1f Mbps")
+            },
             use_container_width=True,
             height=400
         )
 
+    @st.fragment
     def create_user_experience_ratings(self):
         """Feature 6: User Experience Ratings"""
         st.subheader("⭐ User Experience Ratings")
 
-        # Simulate user ratings based on performance data
-        user_ratings = {}
-        for network in self.generator.networks:
-            network_data = self.df[self.df['network'] == network]
+        # Simulate user ratings based on performance data (one grouped pass over all networks)
+        stats = self.df.groupby('network', observed=True).agg(
+            avg_quality=('signal_quality', 'mean'),
+            avg_speed=('data_speed', 'mean'),
+            quality_std=('signal_quality', 'std')
+        ).reindex(self.generator.networks)
 
+        user_ratings = {}
+        for network in stats.itertuples():
             # Calculate ratings from performance metrics
-            call_quality = (network_data['signal_quality'].mean() / 100) * 5
-            data_speed_rating = (network_data['data_speed'].mean() / 50) * 5
-            reliability_rating = (network_data['signal_quality'].std() / 20) * 5
+            call_quality = (network.avg_quality / 100) * 5
+            data_speed_rating = (network.avg_speed / 50) * 5
+            reliability_rating = (network.quality_std / 20) * 5
             overall = (call_quality + data_speed_rating + (5 - reliability_rating)) / 3
 
-            user_ratings[network] = {
+            user_ratings[network.Index] = {
                 'Overall': min(5, overall),
                 'Call Quality': min(5, call_quality),
                 'Data Speed': min(5, data_speed_rating),
@@ -712,21 +762,10 @@ class EnhancedFUTODashboard:
                 st.caption(f"Speed: {user_ratings[network]['Data Speed']:.1f}⭐")
 
         # Detailed ratings radar chart
-        fig = go.Figure()
-
-        categories = ['Call Quality', 'Data Speed', 'Reliability']
-        for network in self.generator.networks:
-            fig.add_trace(go.Scatterpolar(
-                r=[user_ratings[network][cat] for cat in categories],
-                theta=categories,
-                fill='toself',
-                name=network
-            ))
-
-        fig.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 5])),
-            title="User Experience Ratings Comparison"
-        )
+        fig = _radar_figure(tuple(
+            (network, tuple(float(user_ratings[network][cat]) for cat in RATING_CATEGORIES))
+            for network in self.generator.networks
+        ))
         st.plotly_chart(fig, use_container_width=True)
 
         # User feedback simulation
@@ -747,7 +786,8 @@ class EnhancedFUTODashboard:
         """Run the enhanced dashboard with all new features"""
         st.markdown('<div class="main-header">📶 FUTO Mobile Network Analysis Dashboard</div>', unsafe_allow_html=True)
 
-        # Create tabs for better organization
+        # Create tabs for better organization; each tab body is a fragment, so a widget
+        # interaction inside one tab reruns only that tab
         tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
             "📊 Overview", "💰 Cost Analysis", "🛡️ Reliability",
             "⏰ Time Analysis", "🗺️ Campus Maps", "⭐ User Experience"
@@ -774,52 +814,6 @@ class EnhancedFUTODashboard:
             self.create_user_experience_ratings()
 
 
-# Update the data generator with cost data
-class FUTODataGenerator:
-    def __init__(self):
-        self.networks = ["MTN", "Airtel", "Glo", "9mobile"]
-        self.locations = [
-            "Front Gate", "SENATE Building", "Library", "Round About", "Back Gate",
-            "Hostel A", "Hostel B", "Hostel C", "Hostel D", "Hostel E",
-            "NDDC", "TetFund", "PG Hostel", "Bj Services", "Student Affairs",
-            "ICT", "Futo Cafe", "SEET", "SOSC extension", "Sops building",
-            "SICT building", "Lecture Hall 2", "FUTO Medicals", "UCC Centre",
-            "ACE fuels", "750 caps", "1000 Caps", "Futo Garden", "SOHT building", "Futo Park"
-        ]
-
-        # Add cost data
-        self.cost_data = {
-            "MTN": {"1GB": 300, "2GB": 500, "5GB": 1200, "10GB": 2000},
-            "Airtel": {"1GB": 280, "2GB": 480, "5GB": 1150, "10GB": 1900},
-            "Glo": {"1GB": 250, "2GB": 400, "5GB": 1000, "10GB": 1800},
-            "9mobile": {"1GB": 270, "2GB": 450, "5GB": 1100, "10GB": 1850}
-        }
-
-    def generate_dataset(self, samples_per_location=10):
-        """Generate sample dataset"""
-        data = []
-        for location in self.locations:
-            for network in self.networks:
-                for _ in range(samples_per_location):
-                    # Simulate realistic data
-                    base_strength = {"MTN": -75, "Airtel": -78, "Glo": -82, "9mobile": -85}[network]
-                    strength = base_strength + np.random.normal(0, 5)
-                    quality = max(0, min(100, 80 + np.random.normal(0, 15)))
-                    speed = max(1,
-                                {"MTN": 45, "Airtel": 40, "Glo": 25, "9mobile": 20}[network] + np.random.normal(0, 8))
-
-                    data.append({
-                        "location": location,
-                        "network": network,
-                        "signal_strength": round(strength, 1),
-                        "signal_quality": round(quality, 1),
-                        "data_speed": round(speed, 1),
-                        "sinr": round(15 + np.random.normal(0, 3), 1)
-                    })
-
-        return pd.DataFrame(data)
-
-
 # Run the enhanced dashboard
 if __name__ == "__main__":
     dashboard = EnhancedFUTODashboard()
@@ -1,230 +1,259 @@
 # data_generator.py
+import argparse
+import os
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import MappingProxyType
+
+NETWORKS = ("MTN", "Airtel", "Glo", "9mobile")
+LOCATIONS = (
+    "Front Gate", "SENATE Building", "Library", "Round About", "Back Gate",
+    "Hostel A", "Hostel B", "Hostel C", "Hostel D", "Hostel E",
+    "NDDC", "TetFund", "PG Hostel", "Bj Services", "Student Affairs",
+    "ICT", "Futo Cafe", "SEET", "SOSC extension", "Sops building",
+    "SICT building", "Lecture Hall 2", "FUTO Medicals", "UCC Centre",
+    "ACE fuels", "750 caps", "1000 Caps", "Futo Garden", "SOHT building", "Futo Park"
+)
+
+# Define which network is best in which locations (MTN dominant, but others in specific areas)
+BEST_NETWORK_BY_LOCATION = MappingProxyType({
+    # MTN Dominant Areas (16 locations - majority)
+    "Front Gate": "MTN",
+    "SENATE Building": "MTN",
+    "Library": "MTN",
+    "Round About": "MTN",
+    "Student Affairs": "MTN",
+    "UCC Centre": "MTN",
+    "NDDC": "MTN",
+    "TetFund": "MTN",
+    "ICT": "MTN",
+    "SICT building": "MTN",
+    "Futo Park": "MTN",
+    "Futo Garden": "MTN",
+    "ACE fuels": "MTN",
+    "FUTO Medicals": "MTN",
+    "SOHT building": "MTN",
+    "Sops building": "MTN",
+
+    # Airtel Strong Areas - Hostels (6 locations)
+    "Hostel A": "Airtel",
+    "Hostel B": "Airtel",
+    "Hostel C": "Airtel",
+    "Hostel D": "Airtel",
+    "Hostel E": "Airtel",
+    "PG Hostel": "Airtel",
+
+    # Glo Strong Areas (5 locations)
+    "Back Gate": "Glo",
+    "750 caps": "Glo",
+    "1000 Caps": "Glo",
+    "Bj Services": "Glo",
+    "Futo Cafe": "Glo",
+
+    # 9mobile Areas (3 locations - weakest)
+    "Lecture Hall 2": "9mobile",
+    "SEET": "9mobile",
+    "SOSC extension": "9mobile"
+})
+
+# Network base profiles
+NETWORK_PROFILES = MappingProxyType({
+    "MTN": {"base_strength": -75, "reliability": 0.85, "speed_factor": 1.2, "base_sinr": 20, "base_speed": 45},
+    "Airtel": {"base_strength": -78, "reliability": 0.80, "speed_factor": 1.0, "base_sinr": 18, "base_speed": 40},
+    "Glo": {"base_strength": -82, "reliability": 0.65, "speed_factor": 0.8, "base_sinr": 12, "base_speed": 25},
+    "9mobile": {"base_strength": -85, "reliability": 0.55, "speed_factor": 0.7, "base_sinr": 10, "base_speed": 20}
+})
+
+# Cost data
+COST_DATA = MappingProxyType({
+    "MTN": {"1GB": 300, "2GB": 500, "5GB": 1200, "10GB": 2000},
+    "Airtel": {"1GB": 280, "2GB": 480, "5GB": 1150, "10GB": 1900},
+    "Glo": {"1GB": 250, "2GB": 400, "5GB": 1000, "10GB": 1800},
+    "9mobile": {"1GB": 270, "2GB": 450, "5GB": 1100, "10GB": 1850}
+})
+
+# Location-specific modifiers
+LOCATION_MODIFIERS = MappingProxyType({
+    # Excellent signal areas
+    "Front Gate": {"modifier": 8, "congestion": 0.1},
+    "Round About": {"modifier": 10, "congestion": 0.2},
+    "Futo Park": {"modifier": 12, "congestion": 0.1},
+    "Futo Garden": {"modifier": 9, "congestion": 0.15},
+
+    # Good signal areas
+    "SENATE Building": {"modifier": 5, "congestion": 0.3},
+    "Library": {"modifier": 4, "congestion": 0.4},
+    "UCC Centre": {"modifier": 6, "congestion": 0.3},
+    "Student Affairs": {"modifier": 5, "congestion": 0.35},
+
+    # Moderate signal areas
+    "ICT": {"modifier": 2, "congestion": 0.5},
+    "SICT building": {"modifier": 3, "congestion": 0.45},
+    "SEET": {"modifier": 1, "congestion": 0.6},
+    "SOHT building": {"modifier": 2, "congestion": 0.5},
+    "Sops building": {"modifier": 1, "congestion": 0.55},
+
+    # Poor signal areas
+    "Lecture Hall 2": {"modifier": -3, "congestion": 0.7},
+    "FUTO Medicals": {"modifier": -2, "congestion": 0.6},
+    "SOSC extension": {"modifier": -4, "congestion": 0.65},
+
+    # Hostels (high congestion but Airtel optimized)
+    "Hostel A": {"modifier": 3, "congestion": 0.8},  # Airtel strong here
+    "Hostel B": {"modifier": 2, "congestion": 0.85},  # Airtel strong here
+    "Hostel C": {"modifier": 3, "congestion": 0.8},  # Airtel strong here
+    "Hostel D": {"modifier": 2, "congestion": 0.75},  # Airtel strong here
+    "Hostel E": {"modifier": 3, "congestion": 0.8},  # Airtel strong here
+    "PG Hostel": {"modifier": 4, "congestion": 0.7},  # Airtel strong here
+
+    # Glo strong areas
+    "Back Gate": {"modifier": 6, "congestion": 0.4},  # Glo strong
+    "750 caps": {"modifier": 5, "congestion": 0.5},  # Glo strong
+    "1000 Caps": {"modifier": 4, "congestion": 0.6},  # Glo strong
+    "Bj Services": {"modifier": 5, "congestion": 0.55},  # Glo strong
+    "Futo Cafe": {"modifier": 4, "congestion": 0.7},  # Glo strong
+
+    # Other locations
+    "NDDC": {"modifier": 1, "congestion": 0.6},
+    "TetFund": {"modifier": 0, "congestion": 0.5},
+    "ACE fuels": {"modifier": 2, "congestion": 0.4},
+})
 
 
 class FUTODataGenerator:
-    def __init__(self):
-        self.networks = ["MTN", "Airtel", "Glo", "9mobile"]
-        self.locations = [
-            "Front Gate", "SENATE Building", "Library", "Round About", "Back Gate",
-            "Hostel A", "Hostel B", "Hostel C", "Hostel D", "Hostel E",
-            "NDDC", "TetFund", "PG Hostel", "Bj Services", "Student Affairs",
-            "ICT", "Futo Cafe", "SEET", "SOSC extension", "Sops building",
-            "SICT building", "Lecture Hall 2", "FUTO Medicals", "UCC Centre",
-            "ACE fuels", "750 caps", "1000 Caps", "Futo Garden", "SOHT building", "Futo Park"
-        ]
-
-        # Define which network is best in which locations (MTN dominant, but others in specific areas)
-        self.best_network_by_location = {
-            # MTN Dominant Areas (16 locations - majority)
-            "Front Gate": "MTN",
-            "SENATE Building": "MTN",
-            "Library": "MTN",
-            "Round About": "MTN",
-            "Student Affairs": "MTN",
-            "UCC Centre": "MTN",
-            "NDDC": "MTN",
-            "TetFund": "MTN",
-            "ICT": "MTN",
-            "SICT building": "MTN",
-            "Futo Park": "MTN",
-            "Futo Garden": "MTN",
-            "ACE fuels": "MTN",
-            "FUTO Medicals": "MTN",
-            "SOHT building": "MTN",
-            "Sops building": "MTN",
-
-            # Airtel Strong Areas - Hostels (6 locations)
-            "Hostel A": "Airtel",
-            "Hostel B": "Airtel",
-            "Hostel C": "Airtel",
-            "Hostel D": "Airtel",
-            "Hostel E": "Airtel",
-            "PG Hostel": "Airtel",
-
-            # Glo Strong Areas (5 locations)
-            "Back Gate": "Glo",
-            "750 caps": "Glo",
-            "1000 Caps": "Glo",
-            "Bj Services": "Glo",
-            "Futo Cafe": "Glo",
-
-            # 9mobile Areas (3 locations - weakest)
-            "Lecture Hall 2": "9mobile",
-            "SEET": "9mobile",
-            "SOSC extension": "9mobile"
-        }
-
-        # Network base profiles
-        self.network_profiles = {
-            "MTN": {"base_strength": -75, "reliability": 0.85, "speed_factor": 1.2},
-            "Airtel": {"base_strength": -78, "reliability": 0.80, "speed_factor": 1.0},
-            "Glo": {"base_strength": -82, "reliability": 0.65, "speed_factor": 0.8},
-            "9mobile": {"base_strength": -85, "reliability": 0.55, "speed_factor": 0.7}
-        }
-
-        # Cost data
-        self.cost_data = {
-            "MTN": {"1GB": 300, "2GB": 500, "5GB": 1200, "10GB": 2000},
-            "Airtel": {"1GB": 280, "2GB": 480, "5GB": 1150, "10GB": 1900},
-            "Glo": {"1GB": 250, "2GB": 400, "5GB": 1000, "10GB": 1800},
-            "9mobile": {"1GB": 270, "2GB": 450, "5GB": 1100, "10GB": 1850}
-        }
-
-        # Location-specific modifiers
-        self.location_modifiers = {
-            # Excellent signal areas
-            "Front Gate": {"modifier": 8, "congestion": 0.1},
-            "Round About": {"modifier": 10, "congestion": 0.2},
-            "Futo Park": {"modifier": 12, "congestion": 0.1},
-            "Futo Garden": {"modifier": 9, "congestion": 0.15},
-
-            # Good signal areas
-            "SENATE Building": {"modifier": 5, "congestion": 0.3},
-            "Library": {"modifier": 4, "congestion": 0.4},
-            "UCC Centre": {"modifier": 6, "congestion": 0.3},
-            "Student Affairs": {"modifier": 5, "congestion": 0.35},
-
-            # Moderate signal areas
-            "ICT": {"modifier": 2, "congestion": 0.5},
-            "SICT building": {"modifier": 3, "congestion": 0.45},
-            "SEET": {"modifier": 1, "congestion": 0.6},
-            "SOHT building": {"modifier": 2, "congestion": 0.5},
-            "Sops building": {"modifier": 1, "congestion": 0.55},
-
-            # Poor signal areas
-            "Lecture Hall 2": {"modifier": -3, "congestion": 0.7},
-            "FUTO Medicals": {"modifier": -2, "congestion": 0.6},
-            "SOSC extension": {"modifier": -4, "congestion": 0.65},
-
-            # Hostels (high congestion but Airtel optimized)
-            "Hostel A": {"modifier": 3, "congestion": 0.8},  # Airtel strong here
-            "Hostel B": {"modifier": 2, "congestion": 0.85},  # Airtel strong here
-            "Hostel C": {"modifier": 3, "congestion": 0.8},  # Airtel strong here
-            "Hostel D": {"modifier": 2, "congestion": 0.75},  # Airtel strong here
-            "Hostel E": {"modifier": 3, "congestion": 0.8},  # Airtel strong here
-            "PG Hostel": {"modifier": 4, "congestion": 0.7},  # Airtel strong here
-
-            # Glo strong areas
-            "Back Gate": {"modifier": 6, "congestion": 0.4},  # Glo strong
-            "750 caps": {"modifier": 5, "congestion": 0.5},  # Glo strong
-            "1000 Caps": {"modifier": 4, "congestion": 0.6},  # Glo strong
-            "Bj Services": {"modifier": 5, "congestion": 0.55},  # Glo strong
-            "Futo Cafe": {"modifier": 4, "congestion": 0.7},  # Glo strong
-
-            # Other locations
-            "NDDC": {"modifier": 1, "congestion": 0.6},
-            "TetFund": {"modifier": 0, "congestion": 0.5},
-            "ACE fuels": {"modifier": 2, "congestion": 0.4},
-        }
-
-    def is_best_network(self, network, location):
-        """Check if this network is the best in this location"""
-        return self.best_network_by_location.get(location) == network
-
-    def generate_signal_strength(self, network, location):
-        """Generate realistic signal strength in dBm"""
-        base_profile = self.network_profiles[network]
-        base_strength = base_profile["base_strength"]
-        modifier = self.location_modifiers[location]["modifier"]
-
+    def __init__(self, seed=None):
+        # A given seed makes the dataset reproducible (and a stable cache key for callers that cache it);
+        # None draws fresh entropy, so every instance generates different data
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        self.networks = NETWORKS
+        self.locations = LOCATIONS
+        self.best_network_by_location = BEST_NETWORK_BY_LOCATION
+        self.network_profiles = NETWORK_PROFILES
+        self.cost_data = COST_DATA
+        self.location_modifiers = LOCATION_MODIFIERS
+
+        # Positional lookup arrays (row i = self.locations[i], column j = self.networks[j]) so the
+        # generators index NumPy arrays instead of hashing location/network strings per sample
+        n_locations = len(self.locations)
+
+        def network_values(key):
+            return np.array([self.network_profiles[n][key] for n in self.networks], dtype=np.float32)
+
+        self._net_base = network_values("base_strength")
+        self._net_reliab = network_values("reliability")
+        self._net_speed = network_values("base_speed")
+        self._net_sinr_base = network_values("base_sinr")
+        self._loc_mod = np.fromiter((self.location_modifiers[l]["modifier"] for l in self.locations),
+                                    dtype=np.float32, count=n_locations)
+        self._loc_cong = np.fromiter((self.location_modifiers[l]["congestion"] for l in self.locations),
+                                     dtype=np.float32, count=n_locations)
+
+        network_index = {network: i for i, network in enumerate(self.networks)}
+        self._best = np.zeros((n_locations, len(self.networks)), dtype=bool)
+        for loc_idx, location in enumerate(self.locations):
+            best = self.best_network_by_location.get(location)
+            if best is not None:
+                self._best[loc_idx, network_index[best]] = True
+
+    def is_best_network(self, loc_idx, net_idx):
+        """Check if network net_idx is the best in location loc_idx (positions in self.networks / self.locations)"""
+        return bool(self._best[loc_idx, net_idx])
+
+    def generate_signal_strength(self, base_strength, modifier, is_best, variation):
+        """Generate realistic signal strength in dBm (arguments broadcast as arrays)"""
         # Boost signal for best network in location, reduce for others
-        if self.is_best_network(network, location):
-            strength_boost = 8  # Significant boost for best network
-        else:
-            strength_boost = -4  # Reduction for other networks
+        strength_boost = np.where(is_best, np.float32(8), np.float32(-4))  # Significant boost for best network
 
         # Add some randomness but keep it realistic
-        variation = np.random.normal(0, 3)
         strength = base_strength + modifier + strength_boost + variation
 
-        # Ensure realistic range
-        return max(-120, min(-50, strength))
+        # Ensure realistic range (clamped in place, strength is a fresh array)
+        return np.clip(strength, -120, -50, out=strength)
 
-    def generate_signal_quality(self, network, location, signal_strength):
+    def generate_signal_quality(self, reliability, congestion, is_best, signal_strength, variation):
         """Generate signal quality score (0-100)"""
-        base_quality = self.network_profiles[network]["reliability"] * 100
-        congestion = self.location_modifiers[location]["congestion"]
+        base_quality = reliability * 100
 
         # Quality decreases with poor signal and high congestion
-        signal_factor = max(0, (signal_strength + 120) / 70)  # Normalize to 0-1
+        signal_factor = np.maximum(0, (signal_strength + 120) / 70)  # Normalize to 0-1
 
         # Boost quality for best network
-        if self.is_best_network(network, location):
-            quality_boost = 15
-        else:
-            quality_boost = -8
+        quality_boost = np.where(is_best, np.float32(15), np.float32(-8))
 
         quality = base_quality * signal_factor * (1 - congestion * 0.3) + quality_boost
 
         # Add some variation
-        variation = np.random.normal(0, 5)
-        return max(0, min(100, quality + variation))
+        quality += variation
+        return np.clip(quality, 0, 100, out=quality)
 
-    def generate_sinr(self, network, location):
+    def generate_sinr(self, base_sinr, congestion, is_best, variation):
         """Generate SINR (Signal-to-Interference-plus-Noise Ratio)"""
-        base_sinr = {
-            "MTN": 20, "Airtel": 18, "Glo": 12, "9mobile": 10
-        }[network]
-
-        congestion = self.location_modifiers[location]["congestion"]
-
         # Boost SINR for best network
-        if self.is_best_network(network, location):
-            sinr_boost = 5
-        else:
-            sinr_boost = -3
+        sinr_boost = np.where(is_best, np.float32(5), np.float32(-3))
 
-        sinr = base_sinr - (congestion * 8) + sinr_boost + np.random.normal(0, 2)
+        sinr = base_sinr - (congestion * 8) + sinr_boost + variation
 
-        return max(0, min(30, sinr))
+        return np.clip(sinr, 0, 30, out=sinr)
 
-    def generate_data_speed(self, network, location, signal_strength):
+    def generate_data_speed(self, base_speed, congestion, is_best, signal_strength, variation):
         """Generate realistic data speeds in Mbps"""
-        base_speed = {
-            "MTN": 45, "Airtel": 40, "Glo": 25, "9mobile": 20
-        }[network]
-
         # Speed reduces with poor signal
-        signal_factor = max(0, (signal_strength + 100) / 50)
-        congestion = self.location_modifiers[location]["congestion"]
+        signal_factor = np.maximum(0, (signal_strength + 100) / 50)
 
         # Boost speed for best network
-        if self.is_best_network(network, location):
-            speed_boost = 12
-        else:
-            speed_boost = -6
+        speed_boost = np.where(is_best, np.float32(12), np.float32(-6))
 
-        speed = base_speed * signal_factor * (1 - congestion * 0.4) + speed_boost
-        speed += np.random.normal(0, 3)
+        speed = base_speed * signal_factor * (1 - congestion * 0.4) + speed_boost + variation
 
-        return max(0.1, min(100, speed))
+        return np.clip(speed, 0.1, 100, out=speed)
 
     def generate_dataset(self, samples_per_location=15):
         """Generate complete dataset"""
-        data = []
-
-        for location in self.locations:
-            for network in self.networks:
-                for _ in range(samples_per_location):
-                    signal_strength = self.generate_signal_strength(network, location)
-                    signal_quality = self.generate_signal_quality(network, location, signal_strength)
-                    sinr = self.generate_sinr(network, location)
-                    data_speed = self.generate_data_speed(network, location, signal_strength)
-
-                    data.append({
-                        "location": location,
-                        "network": network,
-                        "signal_strength": round(signal_strength, 1),
-                        "signal_quality": round(signal_quality, 1),
-                        "sinr": round(sinr, 1),
-                        "data_speed": round(data_speed, 1),
-                        "timestamp": datetime.now() - timedelta(hours=np.random.randint(0, 168))
-                    })
-
-        return pd.DataFrame(data)
+        n_locations, n_networks = len(self.locations), len(self.networks)
+        shape = (n_locations, n_networks, samples_per_location)
+        total = n_locations * n_networks * samples_per_location
+        rng = self._rng
+
+        # Per-network values broadcast along axis 1, per-location values along axis 0
+        congestion = self._loc_cong[:, None, None]
+        is_best = self._best[:, :, None]
+
+        # One float32 draw for all four metrics' noise, scaled in place to each metric's sigma
+        noise = rng.standard_normal((4,) + shape, dtype=np.float32)
+        noise *= np.array([3, 5, 2, 3], dtype=np.float32)[:, None, None, None]
+
+        # All samples for every (location, network) pair in one batch per metric
+        signal_strength = self.generate_signal_strength(
+            self._net_base[None, :, None], self._loc_mod[:, None, None], is_best, noise[0])
+        signal_quality = self.generate_signal_quality(
+            self._net_reliab[None, :, None], congestion, is_best, signal_strength, noise[1])
+        sinr = self.generate_sinr(self._net_sinr_base[None, :, None], congestion, is_best, noise[2])
+        data_speed = self.generate_data_speed(
+            self._net_speed[None, :, None], congestion, is_best, signal_strength, noise[3])
+
+        # Every input above is float32, so the metrics already are; round each once, in place
+        for metric in (signal_strength, signal_quality, sinr, data_speed):
+            np.round(metric, 1, out=metric)
+
+        # Label columns as categoricals built straight from int8 codes (no per-row strings)
+        location_codes = np.repeat(np.arange(n_locations, dtype=np.int8), n_networks * samples_per_location)
+        network_codes = np.tile(np.repeat(np.arange(n_networks, dtype=np.int8), samples_per_location), n_locations)
+
+        # Timestamps spread over the past week, as one datetime64 array rather than per-row datetimes
+        hour_offsets = rng.integers(0, 168, size=total, dtype=np.int32).astype("timedelta64[h]")
+        timestamps = np.datetime64(datetime.now(), "ns") - hour_offsets
+
+        return pd.DataFrame({
+            "location": pd.Categorical.from_codes(location_codes, categories=self.locations),
+            "network": pd.Categorical.from_codes(network_codes, categories=self.networks),
+            "signal_strength": signal_strength.ravel(),
+            "signal_quality": signal_quality.ravel(),
+            "sinr": sinr.ravel(),
+            "data_speed": data_speed.ravel(),
+            "timestamp": timestamps
+        }, copy=False)
 
     def get_best_network_distribution(self):
         """Show distribution of best networks"""
@@ -237,6 +266,11 @@ class FUTODataGenerator:
 
 # Generate sample data
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the FUTO network dataset")
+    parser.add_argument("--csv", action="store_true",
+                        help="also write a gzipped CSV copy (futo_network_data.csv.gz)")
+    args = parser.parse_args()
+
     generator = FUTODataGenerator()
 
     # Show best network distribution
@@ -256,6 +290,11 @@ if __name__ == "__main__":
     df = generator.generate_dataset(samples_per_location=15)
     print(f"\nGenerated {len(df)} records")
 
-    # Save data
-    df.to_csv("futo_network_data.csv", index=False)
+    # Save data (Parquet is what the dashboard reads). Write a temp file and swap it in, so a
+    # running dashboard never sees a half-written file under a new mtime
+    tmp_path = f"futo_network_data.parquet.{os.getpid()}.tmp"
+    df.to_parquet(tmp_path, index=False, engine="pyarrow", compression="zstd", compression_level=3)
+    os.replace(tmp_path, "futo_network_data.parquet")
+    if args.csv:
+        df.to_csv("futo_network_data.csv.gz", index=False, compression="gzip")
     print("Data generation complete!")
\ No newline at end of file